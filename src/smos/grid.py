@@ -1,10 +1,114 @@
 # -*- coding: utf-8 -*-
 
-from pygeogrids.grids import CellGrid, BasicGrid, lonlat2cell
+from functools import lru_cache
+from pygeogrids.grids import CellGrid, lonlat2cell
 from ease_grid import EASE2_grid
 import numpy as np
 
 
+def _dims2cell(londim, latdim, cellsize=5.):
+    """
+    Cell numbers for all points of a regular lon/lat grid. The cell number
+    of pygeogrids (lonlat2cell) is a sum of a longitude and a latitude part,
+    so it is only computed for the 1D dimensions and then broadcast to the
+    full (lat, lon) grid, instead of for each grid point.
+
+    Parameters
+    ----------
+    londim : np.ndarray
+        1D longitudes of the grid columns
+    latdim : np.ndarray
+        1D latitudes of the grid rows (in the order of the flat grid)
+    cellsize : float, optional (default: 5.)
+        Cell size in degrees.
+
+    Returns
+    -------
+    cells : np.ndarray
+        Flat cell numbers (int32) of the grid points, same as
+        lonlat2cell(lons, lats, cellsize) on the flattened grid.
+    """
+    lon_cells = lonlat2cell(londim, np.full(londim.shape, -90.), cellsize)
+    lat_cells = lonlat2cell(np.full(latdim.shape, -180.), latdim, cellsize)
+    return np.add.outer(lat_cells, lon_cells).ravel().astype(np.int32)
+
+
+@lru_cache(maxsize=1)
+def _build_ease25():
+    """
+    Build the global EASE25 grid definition. The result is cached, so that
+    creating multiple grids (e.g. for the default arguments of the readers,
+    or repeated reshuffle calls) does not rebuild the coordinate and cell
+    arrays every time.
+
+    Returns
+    -------
+    londim : np.ndarray
+        1D longitudes of the grid columns (read-only)
+    latdim : np.ndarray
+        1D latitudes of the grid rows, south to north (read-only)
+    lons : np.ndarray
+        Longitudes of all global grid points (read-only)
+    lats : np.ndarray
+        Latitudes of all global grid points (read-only)
+    cells : np.ndarray
+        5x5 degree cell numbers of all global grid points (read-only)
+    shape : tuple
+        Shape of the global grid (lat, lon)
+    """
+    ease25 = EASE2_grid(25000)
+    assert np.all(np.diff(ease25.latdim) < 0)  # latitudes from north to south
+    shape = (ease25.latdim.size, ease25.londim.size)
+
+    londim = ease25.londim
+    latdim = ease25.latdim[::-1]  # flip lats, so that origin in bottom left
+    lons = np.tile(londim, shape[0])
+    lats = np.repeat(latdim, shape[1])
+
+    cells = _dims2cell(londim, latdim, 5.)
+
+    # arrays are shared between all grids
+    for arr in (londim, latdim, lons, lats, cells):
+        arr.setflags(write=False)
+
+    return londim, latdim, lons, lats, cells, shape
+
+
+@lru_cache(maxsize=8)
+def _ease25_subset(bbox=None):
+    """
+    Select the global EASE25 grid points in a bounding box. Only the subset
+    is cached per bbox, the global arrays are shared (see _build_ease25).
+
+    Parameters
+    ----------
+    bbox: tuple, optional (default: None)
+        (min_lon, min_lat, max_lon, max_lat), must be hashable.
+
+    Returns
+    -------
+    sgpis : np.ndarray
+        Indices of the grid points in the bounding box (read-only)
+    subset_shape : tuple
+        Shape of the subset (lat, lon)
+    """
+    londim, latdim, _, _, _, shape = _build_ease25()
+
+    if bbox:
+        # rows and columns in the bbox (limits are inclusive)
+        in_rows = (latdim >= bbox[1]) & (latdim <= bbox[3])
+        in_cols = (londim >= bbox[0]) & (londim <= bbox[2])
+        sgpis = np.flatnonzero(np.logical_and.outer(in_rows, in_cols))
+        subset_shape = (np.count_nonzero(in_rows), np.count_nonzero(in_cols))
+    else:
+        sgpis = np.arange(shape[0] * shape[1])
+        subset_shape = shape
+
+    sgpis.setflags(write=False)
+
+    return sgpis, subset_shape
+
+
 class EASE25CellGrid(CellGrid):
     """ CellGrid version of EASE25 Grid as used in SMOS IC """
 
@@ -18,40 +122,24 @@ class EASE25CellGrid(CellGrid):
             grid is used.
         """
 
-        ease25 = EASE2_grid(25000)
-        lons, lats = ease25.londim, ease25.latdim
-
-        lons, lats = np.meshgrid(lons, lats)
-        assert lons.shape == lats.shape
-        shape = lons.shape
-
-        lats = np.flipud(lats)  # flip lats, so that origin in bottom left
-        lons, lats = lons.flatten(), lats.flatten()
-
-        globgrid = BasicGrid(lons, lats, shape=shape)
-        sgpis = globgrid.activegpis
-
         self.bbox = bbox
-        if self.bbox:
-            sgpis = globgrid.get_bbox_grid_points(
-                latmin=self.bbox[1], latmax=self.bbox[3],
-                lonmin=self.bbox[0], lonmax=self.bbox[2])
+
+        _, _, lons, lats, cells, shape = _build_ease25()
+        sgpis, subset_shape = _ease25_subset(tuple(bbox) if self.bbox else None)
 
         self.cellsize = 5.
 
-        super(EASE25CellGrid, self).__init__(lon=globgrid.arrlon,
-                                             lat=globgrid.arrlat,
+        super(EASE25CellGrid, self).__init__(lon=lons,
+                                             lat=lats,
                                              subset=sgpis,
-                                             cells=lonlat2cell(globgrid.arrlon,
-                                                               globgrid.arrlat,
-                                                               self.cellsize),
+                                             cells=cells,
                                              shape=shape)
 
-        self.subset_shape = (len(np.unique(self.activearrlat)),
-                             len(np.unique(self.activearrlon)))
+        self.subset_shape = subset_shape
 
     def cut(self) -> CellGrid:
-        # create a new grid from the active subset
-        return BasicGrid(lon=self.activearrlon, lat=self.activearrlat,
-                         gpis=self.activegpis, subset=None,
-                         shape=self.subset_shape).to_cell_grid(self.cellsize)
+        # create a new grid from the active subset, the cells of the subset
+        # points are already known and don't have to be computed again
+        return CellGrid(lon=self.activearrlon, lat=self.activearrlat,
+                        cells=self.activearrcell, gpis=self.activegpis,
+                        subset=None, shape=self.subset_shape)
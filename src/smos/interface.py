@@ -22,6 +22,7 @@
 # SOFTWARE.
 
 import os
+import fnmatch
 import warnings
 import numpy as np
 import pandas as pd
@@ -31,12 +32,20 @@ from pygeogrids.netcdf import load_grid
 
 from pygeobase.io_base import ImageBase, MultiTemporalImageBase
 from pygeobase.object_base import Image
-from datetime import timedelta, datetime
-from netCDF4 import Dataset, date2num, num2date
+from datetime import datetime
+from netCDF4 import Dataset, date2num
 from smos.grid import EASE25CellGrid
 from smos import dist_name as subdist_name
 from smos import dist_name, __version__
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def _load_grid(grid_path, mtime):
+    # grid files are shared between time series readers, the modification
+    # time is part of the key, so that a re-created grid file is loaded again
+    return load_grid(grid_path)
 
 
 class SMOSTs(GriddedNcOrthoMultiTs):
@@ -76,10 +85,12 @@ class SMOSTs(GriddedNcOrthoMultiTs):
             ioclass_kws: dict
                 Optional keyword arguments to pass to OrthoMultiTs class:
                 ----------------------------------------------------------------
-                    read_bulk : boolean, optional (default:False)
+                    read_bulk : boolean, optional (default:True)
                         if set to True the data of all locations is read into memory,
                         and subsequent calls to read_ts read from the cache and not from disk
-                        this makes reading complete files faster#
+                        this makes reading complete files faster. Unlike in
+                        pynetcf, this is activated by default here, as the
+                        cell files of reshuffled SMOS data are small.
                     read_dates : boolean, optional (default:False)
                         if false dates will not be read automatically but only on specific
                         request useable for bulk reading because currently the netCDF
@@ -92,7 +103,13 @@ class SMOSTs(GriddedNcOrthoMultiTs):
             grid_path = os.path.join(ts_path, "grid.nc")
 
         self.drop_missing = drop_missing
-        grid = load_grid(grid_path)
+        grid_path = os.path.abspath(grid_path)
+        grid = _load_grid(grid_path, os.path.getmtime(grid_path))
+
+        ioclass_kws = dict(kwargs.pop('ioclass_kws', None) or {})
+        ioclass_kws.setdefault('read_bulk', True)
+        kwargs['ioclass_kws'] = ioclass_kws
+
         super(SMOSTs, self).__init__(ts_path, grid, **kwargs)
 
         self.index_add_time = index_add_time
@@ -102,7 +119,7 @@ class SMOSTs(GriddedNcOrthoMultiTs):
 
     def _to_datetime(self, df:pd.DataFrame) -> pd.DataFrame:
         # convert Days and UTC_Seconds to actual datetimes
-        units = self._t0_unit
+        t0 = pd.Timestamp(self._t0_unit.split('since')[1].strip())
 
         df['_date'] = df.index.values
 
@@ -111,17 +128,12 @@ class SMOSTs(GriddedNcOrthoMultiTs):
             raise KeyError(f"Could not find {self._t0_vars['days']} or {self._t0_vars['sec']} "
                            f"in reshuffled data.")
 
+        # t0 + days + seconds, converted at once, missing values lead to NaT
+        secs = df[self._t0_vars['days']].values * 86400. \
+            + df[self._t0_vars['sec']].values
+        dt = t0 + pd.to_timedelta(secs, unit='s')
 
-        # days + (seconds / seconds per day)
-        num = df[self._t0_vars['days']].dropna() + (df[self._t0_vars['sec']].dropna() / 86400.)
-        if len(num) == 0:
-            df.loc[num.index, '_datetime_UTC'] = []
-        else:
-            df.loc[num.index, '_datetime_UTC'] = \
-                pd.DatetimeIndex(num2date(num.values, units=units,
-                        calendar='standard', only_use_cftime_datetimes=False))
-
-        df = df.set_index('_datetime_UTC')
+        df.index = pd.DatetimeIndex(dt, name='_datetime_UTC')
         df = df[df.index.notnull()]
         return df
 
@@ -148,13 +160,23 @@ class SMOSTs(GriddedNcOrthoMultiTs):
 
         ts = super(SMOSTs, self).read(*args, **kwargs)
 
-        if self.drop_missing:
-            ts = ts.dropna(how='all')
+        values = ts.to_numpy(dtype=np.float64)
+
+        if self.drop_missing:  # lines where all values are NaN
+            keep = ~np.isnan(values).all(axis=1)
+            if not keep.all():
+                ts, values = ts[keep], values[keep]
+
+        # convert to ints, if possible (all values are finite and whole
+        # numbers), checked for all columns at once
+        with np.errstate(invalid='ignore'):  # the fraction of inf is NaN
+            frac = np.trunc(values)
+            np.subtract(values, frac, out=frac)
+        is_int = (frac == 0).all(axis=0)
 
-        for col in ts:  # convert to ints, if possible
-            if (not np.isnan(ts[col]).any()) and \
-                    (np.all(np.mod(ts[col].values, 1) == 0.)):
-                ts[col] = ts[col].astype(int)
+        if is_int.any():  # replace all converted columns at once
+            ts = ts.assign(**{col: ts[col].values.astype(int)
+                              for col in ts.columns[is_int]})
 
         if self.index_add_time:
             ts = self._to_datetime(ts)
@@ -179,9 +201,9 @@ class SMOSImg(ImageBase):
     flatten: bool, optional (default: False)
         If set then the data is read into 1D arrays. This is used to e.g
         reshuffle the data.
-    grid : pygeogrids.CellGrid, optional (default: EASE25CellGrid)
-        Grid that the image data is organised on, by default the global EASE25
-        grid is used.
+    grid : pygeogrids.CellGrid, optional (default: None)
+        Grid that the image data is organised on, if None is passed the global
+        EASE25 grid is used.
     read_flags : tuple or None, optional (default: (0, 1))
         Filter values to read based on the selected QUALITY_FLAGS.
         Values for locations that are not assigned any of the here passed flags
@@ -193,8 +215,15 @@ class SMOSImg(ImageBase):
         as in the data.
     """
 
+    # name of the quality flag variable that read_flags refers to
+    _flag_var = 'Quality_Flag'
+
+    # HDF5 chunk cache per variable, each chunk of an image is read only once,
+    # so a small cache is enough (larger chunks are read without the cache)
+    _chunk_cache = {'size': 16 * 1024, 'nelems': 7, 'preemption': 0.}
+
     def __init__(self, filename, mode='r', parameters=None, flatten=False,
-                 grid=EASE25CellGrid(bbox=None), read_flags=(0, 1), float_fillval=np.nan):
+                 grid=None, read_flags=(0, 1), float_fillval=np.nan):
 
         super(SMOSImg, self).__init__(filename, mode=mode)
 
@@ -207,16 +236,40 @@ class SMOSImg(ImageBase):
         self.parameters = parameters
         self.flatten = flatten
 
-        self.grid = grid
+        self.grid = EASE25CellGrid(bbox=None) if grid is None else grid
+        # (rows, cols) of the image, other grids than EASE25 have no subset
+        self._img_shape = getattr(self.grid, 'subset_shape', self.grid.shape)
 
         self.image_missing = False
         self.img = None  # to be loaded
         self.glob_attrs = None
+        self._img_lonlat = None  # 2d coordinates, set on first read
 
         self.float_fillval = float_fillval
 
-    def get_global_attrs(self, exclude=('history', 'NCO', 'netcdf_version_id', 'contact',
-                                        'institution', 'creation_time')):
+    def _flag_mask(self, flags):
+        """
+        Mask pixels where the quality flag is not one of the read_flags.
+        Same as ~np.isin(flags, read_flags), but with one comparison per flag
+        value, as there are only few flag values to keep.
+
+        Parameters
+        ----------
+        flags : np.ndarray
+            Quality flag image
+
+        Returns
+        -------
+        flag_mask : np.ndarray
+            True where the pixel is filtered out.
+        """
+        flag_mask = np.ones(flags.shape, dtype=bool)
+        for f in np.atleast_1d(self.read_flags):
+            flag_mask &= (flags != f)
+        return flag_mask
+
+    def get_global_attrs(self, exclude=frozenset(('history', 'NCO', 'netcdf_version_id',
+                                                  'contact', 'institution', 'creation_time'))):
         return {k: v for k, v in self.glob_attrs.items() if k not in exclude}
 
     def _read_empty(self):
@@ -234,21 +287,114 @@ class SMOSImg(ImageBase):
         return_img = {}
         return_metadata = {}
 
-        try:
-            rows, cols = self.grid.subset_shape
-        except AttributeError:
-            rows, cols = self.grid.shape
+        rows, cols = self._img_shape
 
         for param in self.parameters:
-            data = np.full((rows, cols), np.nan)
-            return_img[param] = data.flatten()
+            # flat, same as the data from _read_img
+            return_img[param] = np.full(rows * cols, np.nan)
             return_metadata[param] = {'image_missing': 1}
 
         return return_img, return_metadata
 
+    def _read_metadata(self) -> dict:
+        """
+        Read only the global and variable attributes of the image, without
+        reading (and decompressing) the data. The attributes are the same
+        as in the metadata from _read_img.
+
+        Returns
+        -------
+        metadata : dict
+            Attributes for each object parameter
+        """
+        with Dataset(self.filename) as ds:
+            self.glob_attrs = ds.__dict__
+
+            if len(self.parameters) == 0:
+                # all data vars, exclude coord vars
+                self.parameters = [k for k in ds.variables.keys() if
+                                   ds.variables[k].ndim != 1]
+
+            return {param: {**ds.variables[param].__dict__, 'image_missing': 0}
+                    for param in self.parameters}
+
 
     def _read_img(self) -> (dict, dict):
-        raise NotImplementedError
+        # Read a netcdf image and metadata
+
+        # the file is closed again once all variables are read
+        with Dataset(self.filename) as ds:
+            self.glob_attrs = ds.__dict__
+
+            param_img = {}
+            param_meta = {}
+
+            if len(self.parameters) == 0:
+                # all data vars, exclude coord vars
+                self.parameters = [k for k in ds.variables.keys() if
+                                   ds.variables[k].ndim != 1]
+
+            parameters = list(self.parameters)
+
+            if (self.read_flags is not None) and (self._flag_var not in parameters):
+                parameters.append(self._flag_var)
+
+            for parameter in parameters:
+                param = ds.variables[parameter]
+                if ds.data_model.startswith('NETCDF4'):
+                    param.set_var_chunk_cache(**self._chunk_cache)
+
+                # read long name, FillValue and unit, all attributes at once
+                metadata = param.__dict__
+
+                # only NaNs and flagged pixels are masked (see below), so the
+                # fill value mask of netCDF4 is not needed. Except for scaled
+                # variables, where it keeps the fill value unscaled.
+                param.set_auto_mask(('scale_factor' in metadata) or
+                                    ('add_offset' in metadata))
+                # only the active points (e.g. in the bbox) are kept, so all
+                # further processing is done on the subset of the image
+                data = np.ma.getdata(param[:]).ravel()[self.grid.activegpis]
+
+                metadata['image_missing'] = 0
+
+                param_img[parameter] = data
+                param_meta[parameter] = metadata
+
+        # filter with the flags (this excludes non-land points as well)
+        if self.read_flags is not None:
+            flag_mask = self._flag_mask(param_img[self._flag_var])
+        else:
+            flag_mask = None
+
+        for param, data in param_img.items():
+            # combined mask of missing values and flags, computed once and
+            # in place, without temporary arrays
+            if issubclass(data.dtype.type, np.floating):
+                mask = np.isfinite(data)
+                np.logical_not(mask, out=mask)
+                if flag_mask is not None:
+                    mask |= flag_mask
+            elif flag_mask is not None:  # integers are always finite
+                mask = flag_mask.copy()
+            else:
+                mask = np.zeros(data.shape, dtype=bool)
+
+            if (self.float_fillval is not None) and \
+                    issubclass(data.dtype.type, np.floating):
+                np.putmask(data, mask, self.float_fillval)  # in place
+            else:
+                data = np.ma.masked_array(
+                    data, mask=mask, fill_value=param_meta[param]['_FillValue'])
+
+            param_img[param] = data
+
+        if (self._flag_var in param_img.keys()) and \
+                (self._flag_var not in self.parameters):
+            param_img.pop(self._flag_var)
+            param_meta.pop(self._flag_var)
+
+        return param_img, param_meta
 
 
     def read(self, timestamp):
@@ -276,23 +422,23 @@ class SMOSImg(ImageBase):
                              return_img, return_metadata, timestamp)
 
         else:
-            try:
-                shape = self.grid.subset_shape
-            except AttributeError:
-                shape = self.grid.shape
+            rows, cols = self._img_shape
+            for key in return_img:  # flip rows, as view
+                return_img[key] = return_img[key].reshape(rows, cols)[::-1]
 
-            rows, cols = shape
-            for key in return_img:
-                return_img[key] = np.flipud(return_img[key].reshape(rows, cols))
+            if self._img_lonlat is None:  # the same for all images
+                self._img_lonlat = (
+                    self.grid.activearrlon.reshape(rows, cols),
+                    self.grid.activearrlat.reshape(rows, cols)[::-1])
 
-            self.img = Image(self.grid.activearrlon.reshape(rows, cols),
-                             np.flipud(self.grid.activearrlat.reshape(rows, cols)),
+            self.img = Image(self._img_lonlat[0],
+                             self._img_lonlat[1],
                              return_img,
                              return_metadata,
                              timestamp)
         return self.img
 
-    def write(self, image, **kwargs):
+    def write(self, image, dataset=None, complevel=4, **kwargs):
         """
         Write the image to a separate output path. E.g. after reading only
         a subset of the parameters, or when reading a spatial subset (with a
@@ -303,6 +449,14 @@ class SMOSImg(ImageBase):
         ----------
         image : str
             Path to netcdf file to create.
+        dataset : netCDF4.Dataset, optional (default: None)
+            Already opened (writable) Dataset to write the image to instead of
+            opening the file under the passed path. This is used to append
+            multiple images to a stack without re-opening it for each image.
+            The Dataset is not closed here.
+        complevel : int, optional (default: 4)
+            zlib compression level (0-9) of the image variables, 0 means
+            no compression (faster, but larger files).
         kwargs
             Additional kwargs are given to netcdf4.Dataset
         """
@@ -313,18 +467,25 @@ class SMOSImg(ImageBase):
         if self.img.timestamp is None:
             raise IOError("No time stamp found for current image.")
 
-        lons = np.unique(self.img.lon.flatten())
-        lats = np.flipud(np.unique(self.img.lat.flatten()))
+        if self.img.lon.ndim == 2:  # regular image, north up
+            lons = self.img.lon[0, :]
+            lats = self.img.lat[:, 0]
+        else:
+            lons = np.unique(self.img.lon)
+            lats = np.flipud(np.unique(self.img.lat))
 
-        mode = 'w' if not os.path.isfile(image) else 'a'
-        ds = Dataset(image, mode=mode, **kwargs)
+        if dataset is None:
+            mode = 'w' if not os.path.isfile(image) else 'a'
+            ds = Dataset(image, mode=mode, **kwargs)
+        else:
+            ds = dataset
 
         ds.set_auto_scale(True)
         ds.set_auto_mask(True)
 
         units = 'Days since 2000-01-01 00:00:00'
 
-        if mode == 'w':
+        if 'timestamp' not in ds.dimensions:  # new file
             ds.createDimension('timestamp', None)  # stack dim
             ds.createDimension('lat', len(lats))
             ds.createDimension('lon', len(lons))
@@ -346,17 +507,12 @@ class SMOSImg(ImageBase):
             ds.variables['lat'][:] = lats
             ds.variables['timestamp'][:] = np.array([])
 
-            this_global_attrs = \
-                OrderedDict([('subset_img_creation_time', str(datetime.now())),
-                             ('subset_img_bbox_corners_latlon', str(self.grid.bbox)),
-                             ('subset_software', f"{dist_name} | {subdist_name} | {__version__}")])
-            glob_attrs = self.glob_attrs
-            for k in ['ease_global', 'history', 'creation_time', 'NCO']:
-                try:
-                    glob_attrs.pop(k)
-                except KeyError:
-                    continue
-            glob_attrs.update(this_global_attrs)
+            skip = ('ease_global', 'history', 'creation_time', 'NCO')
+            glob_attrs = {k: v for k, v in self.glob_attrs.items() if k not in skip}
+            glob_attrs.update({
+                'subset_img_creation_time': str(datetime.now()),
+                'subset_img_bbox_corners_latlon': str(self.grid.bbox),
+                'subset_software': f"{dist_name} | {subdist_name} | {__version__}"})
             ds.setncatts(glob_attrs)
 
         idx = ds.variables['timestamp'].shape[0]
@@ -365,13 +521,16 @@ class SMOSImg(ImageBase):
         for var, vardata in self.img.data.items():
 
             if var not in ds.variables.keys():
+                # one chunk per image, so appending an image writes one chunk
                 ds.createVariable(var, vardata.dtype, dimensions=('timestamp', 'lat', 'lon'),
-                                  zlib=True, complevel=6)
+                                  zlib=complevel > 0, complevel=complevel, shuffle=True,
+                                  chunksizes=(1, len(lats), len(lons)))
                 ds.variables[var].setncatts(self.img.metadata[var])
 
             ds.variables[var][-1] = vardata
 
-        ds.close()
+        if dataset is None:
+            ds.close()
 
     def read_masked_data(self, **kwargs):
         raise NotImplementedError
@@ -398,9 +557,9 @@ class SMOSDs(MultiTemporalImageBase):
     flatten: bool, optional (default: False)
         If set then the data is read into 1D arrays. This is used to e.g
         reshuffle the data.
-    grid : pygeogrids.CellGrid, optional (default: EASE25CellGrid)
-        Grid that the image data is organised on, by default the global EASE25
-        grid is used.
+    grid : pygeogrids.CellGrid, optional (default: None)
+        Grid that the image data is organised on, if None is passed the global
+        EASE25 grid is used.
     read_flags : tuple or None, optional (default: (0, 1))
         Filter values to read based on the selected QUALITY_FLAGS.
         Values for locations that are not assigned any of the here passed flags
@@ -414,9 +573,12 @@ class SMOSDs(MultiTemporalImageBase):
 
 
     def __init__(self, data_path, ioclass, parameters=None, flatten=False,
-                 grid=EASE25CellGrid(bbox=None), filename_templ=None,
+                 grid=None, filename_templ=None,
                  read_flags=(0, 1), float_fillval=np.nan, additional_kws=None):
 
+        if grid is None:  # created once and shared by all images
+            grid = EASE25CellGrid(bbox=None)
+
         ioclass_kws = {'parameters': parameters,
                        'flatten': flatten,
                        'grid': grid,
@@ -436,6 +598,58 @@ class SMOSDs(MultiTemporalImageBase):
                          exact_templ=False,
                          ioclass_kws=ioclass_kws)
 
+        self._dir_content = {}  # (mtime, file names) of the (yearly) subdirs
+
+    def _search_files(self, timestamp, custom_templ=None, str_param=None,
+                      custom_datetime_format=None):
+        """
+        Search files for the passed time stamp. Same as the parent method,
+        but the content of each subdirectory is listed only once and then
+        matched against the file name template of each time stamp, instead
+        of a new glob over the directory for each image. The subdirectory is
+        listed again when its modification time changed (files were added or
+        deleted) or when no file is found in the cached listing.
+        """
+        fname_templ = self.fname_templ if custom_templ is None else custom_templ
+
+        if custom_datetime_format is None:
+            custom_datetime_format = self.datetime_format
+
+        fname_templ = fname_templ.format(
+            **{self.dtime_placeholder: custom_datetime_format})
+
+        if str_param is not None:
+            fname_templ = fname_templ.format(**str_param)
+
+        subdir = os.path.join(self.path, *[timestamp.strftime(s) for s in
+                                           self.subpath_templ])
+
+        pattern = timestamp.strftime(fname_templ)
+
+        try:
+            mtime = os.stat(subdir).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self._dir_content.pop(subdir, None)
+            return []
+
+        cached_mtime, content = self._dir_content.get(subdir, (None, []))
+        files = fnmatch.filter(content, pattern)
+
+        if (mtime != cached_mtime) or (len(files) == 0):
+            # list the subdir (again), files were added or removed since the
+            # last listing. A missing file is also looked for again, in case
+            # the mtime did not change (coarse resolution).
+            try:
+                # hidden files are ignored, same as with glob
+                content = sorted(
+                    f for f in os.listdir(subdir) if not f.startswith('.'))
+            except (FileNotFoundError, NotADirectoryError):
+                content = []
+            self._dir_content[subdir] = (mtime, content)
+            files = fnmatch.filter(content, pattern)
+
+        return [os.path.join(subdir, f) for f in files]
+
     def _assemble_img(self, timestamp, mask=False, **kwargs):
         img = None
         try:
@@ -455,8 +669,32 @@ class SMOSDs(MultiTemporalImageBase):
     def read(self, timestamp, **kwargs):
         return self._assemble_img(timestamp, **kwargs)
 
+    def _write_images(self, root_path, timestamps, stackfile, complevel=4,
+                      **kwargs):
+        # read and write the images for the passed time stamps, one by one
+        stack = None  # the stack file is kept open for all images
+        try:
+            for t in timestamps:
+                self.read(t, **kwargs)
+                if self.fid.image_missing:
+                    continue
+                if stackfile is None:
+                    subdir = os.path.join(root_path, str(t.year))
+                    os.makedirs(subdir, exist_ok=True)
+                    filepath = os.path.join(subdir, os.path.basename(self.fid.filename))
+                else:
+                    filepath = os.path.join(root_path, stackfile)
+                    if stack is None:
+                        mode = 'w' if not os.path.isfile(filepath) else 'a'
+                        stack = Dataset(filepath, mode=mode)
+                print(f"{'Write' if not stackfile else 'Stack'} image for {str(t)}...")
+                self.fid.write(filepath, dataset=stack, complevel=complevel)
+        finally:
+            if stack is not None:
+                stack.close()
+
     def write_multiple(self, root_path, start_date, end_date, stackfile='stack.nc',
-                       **kwargs):
+                       n_proc=1, complevel=4, **kwargs):
         """
         Create multiple netcdf files or a netcdf stack in the passed directoy for
         a range of time stamps. Note that stacking gets slower when the stack gets larger.
@@ -475,22 +713,32 @@ class SMOSDs(MultiTemporalImageBase):
             Name of the stack file to create in root_path. If no name is passed
             we create single images instead of a stack with the same name as
             the original images (faster).
+        n_proc : int, optional (default: 1)
+            Number of parallel processes to read and write images. This is
+            only used when single images are created (stackfile=None), all
+            images of a stack are written one after the other. On Windows and
+            macOS, call this from a ``if __name__ == '__main__':`` block.
+        complevel : int, optional (default: 4)
+            zlib compression level (0-9) of the written images, 0 means no
+            compression.
         kwargs:
             kwargs that are passed to the image reading function
         """
         timestamps = self.tstamps_for_daterange(start_date, end_date)
-        for t in timestamps:
-            self.read(t, **kwargs)
-            if self.fid.image_missing:
-                continue
-            if stackfile is None:
-                subdir = os.path.join(root_path, str(t.year))
-                if not os.path.exists(subdir): os.makedirs(subdir)
-                filepath = os.path.join(subdir, os.path.basename(self.fid.filename))
-            else:
-                filepath = os.path.join(root_path, stackfile)
-            print(f"{'Write' if not stackfile else 'Stack'} image for {str(t)}...")
-            self.fid.write(filepath)
+
+        if (stackfile is None) and (n_proc > 1) and (len(timestamps) > 1):
+            # each process writes the separate files for a block of days
+            blocks = [b.tolist() for b in
+                      np.array_split(np.array(timestamps, dtype=object), n_proc)]
+            with ProcessPoolExecutor(max_workers=n_proc) as executor:
+                futures = [executor.submit(self._write_images, root_path,
+                                           block, stackfile, complevel, **kwargs)
+                           for block in blocks if len(block) > 0]
+                for future in futures:
+                    future.result()
+        else:
+            self._write_images(root_path, timestamps, stackfile, complevel,
+                               **kwargs)
 
     def tstamps_for_daterange(self, start_date, end_date):
         """
@@ -507,12 +755,6 @@ class SMOSDs(MultiTemporalImageBase):
             list of datetime objects of each available image between
             start_date and end_date
         """
-        img_offsets = np.array([timedelta(hours=0)])
-
-        timestamps = []
-        diff = end_date - start_date
-        for i in range(diff.days + 1):
-            daily_dates = start_date + timedelta(days=i) + img_offsets
-            timestamps.extend(daily_dates.tolist())
-
-        return timestamps
+        # one image per day
+        return pd.date_range(start_date, end_date, freq='D') \
+            .to_pydatetime().tolist()
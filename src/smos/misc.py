@@ -1,72 +1,63 @@
-import pandas as pd
 import os
+import re
 from datetime import date
 import typing as t
 import yaml
 
+# use the faster C implementation of the yaml parser if available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_DATE_PATTERN = re.compile(r'(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)')
+
+
+def _numeric_dir_range(path: str) -> (t.Union[str, None], t.Union[str, None]):
+    # Names of the sub-folders with the smallest and largest number (e.g.
+    # years), from a single scan of the directory. (None, None) if there
+    # are no numeric sub-folders.
+    with os.scandir(path) as it:
+        folders = [e.name for e in it if e.name.isdigit() and e.is_dir()]
+
+    if not folders:
+        return None, None
+
+    return min(folders, key=int), max(folders, key=int)
+
+
+def _extreme_file(path: str, last: bool = False) -> t.Union[str, None]:
+    # Follow the first (or last) numeric sub-folders (month, day) down from
+    # path and return the first (or last) file name found there.
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    folders = [e.name for e in entries if e.name.isdigit() and e.is_dir()]
+    if folders:
+        folder = max(folders, key=int) if last else min(folders, key=int)
+        return _extreme_file(os.path.join(path, folder), last)
+
+    files = [e.name for e in entries if e.is_file()]
+    if not files:
+        return None
+
+    return max(files) if last else min(files)
+
+
 def _get_first_and_last_file(path: str):
-    # Get list of all years (folders) in the path
-    years = sorted([folder for folder in os.listdir(path) if folder.isdigit()], key=int)
+    # Get the first year and last year (folders) in the path
+    first_year, last_year = _numeric_dir_range(path)
 
-    if not years:
+    if first_year is None:
         return None, None
 
-    # Get the first year and last year
-    first_year = years[0]
-    last_year = years[-1]
-
-    # Handle the first year
-    first_year_path = os.path.join(path, first_year)
-    first_months = sorted([folder for folder in os.listdir(first_year_path) if folder.isdigit()], key=int)
-
-    if first_months:
-        first_month = first_months[0]
-        first_month_path = os.path.join(first_year_path, first_month)
-        first_days = sorted([folder for folder in os.listdir(first_month_path) if folder.isdigit()], key=int)
-
-        if first_days:
-            first_day = first_days[0]
-            first_day_path = os.path.join(first_month_path, first_day)
-            first_files = sorted(os.listdir(first_day_path))
-            first_file = first_files[0] if first_files else None
-        else:
-            first_day_path = first_month_path
-            first_files = sorted(os.listdir(first_day_path))
-            first_file = first_files[0] if first_files else None
-    else:
-        first_month_path = first_year_path
-        first_files = sorted(os.listdir(first_month_path))
-        first_file = first_files[0] if first_files else None
-
-    # Handle the last year
-    last_year_path = os.path.join(path, last_year)
-    last_months = sorted([folder for folder in os.listdir(last_year_path) if folder.isdigit()], key=int, reverse=True)
-
-    if last_months:
-        last_month = last_months[0]
-        last_month_path = os.path.join(last_year_path, last_month)
-        last_days = sorted([folder for folder in os.listdir(last_month_path) if folder.isdigit()], key=int, reverse=True)
-
-        if last_days:
-            last_day = last_days[0]
-            last_day_path = os.path.join(last_month_path, last_day)
-            last_files = sorted(os.listdir(last_day_path))
-        else:
-            last_day_path = last_month_path
-            last_files = sorted(os.listdir(last_day_path))
-    else:
-        last_month_path = last_year_path
-        last_files = sorted(os.listdir(last_month_path))
-
-    return first_file, last_files[-1] if last_files else None
+    return (_extreme_file(os.path.join(path, first_year)),
+            _extreme_file(os.path.join(path, last_year), last=True))
 
 
 def _get_date(f: str) -> t.Union[date, None]:
-    for e in f.split('_'):
+    # first valid YYYYMMDD date in the file name
+    for m in _DATE_PATTERN.finditer(f):
         try:
-            dt = pd.to_datetime(e).to_pydatetime().date()
-            return dt
-        except Exception:
+            return date(*map(int, m.groups()))
+        except ValueError:
             continue
     return None
 
@@ -74,11 +65,12 @@ def _get_date(f: str) -> t.Union[date, None]:
 def get_first_last_day_images(img_path: str) -> \
         (t.Union[date, None], t.Union[date, None]):
     f, l = _get_first_and_last_file(img_path)
-    first_day = _get_date(f) if f is not None else f
-    last_day = _get_date(l) if l is not None else f
+    first_day = _get_date(f) if f is not None else None
+    last_day = _get_date(l) if l is not None else None
 
     return first_day, last_day
 
+
 def read_summary_yml(path: str) -> dict:
     """
     Read image summary and return fields as dict.
@@ -86,6 +78,6 @@ def read_summary_yml(path: str) -> dict:
     path = os.path.join(path, 'overview.yml')
 
     with open(path, 'r') as stream:
-        props = yaml.safe_load(stream)
+        props = yaml.load(stream, Loader=_YamlLoader)
 
-    return props
\ No newline at end of file
+    return props
@@ -27,7 +27,7 @@ from datetime import datetime
 from netCDF4 import Dataset
 
 
-def firstfile(input_root):
+def firstfile(input_root, read_vars=True):
     '''
     Find the first file and read lat and lon and all variables
 
@@ -35,25 +35,34 @@ def firstfile(input_root):
     --------
     input_root : str
         Path to the root dir of image files
+    read_vars : bool, optional (default: True)
+        Open the file to list the variables in it. If False, only the path
+        is searched and None is returned for the variables.
 
     Returns
     --------
     firstfile : str
         Path to the first found image file in the input_root
-    vars : list
+    vars : list or None
         List of variables in the file
     '''
+    # depth-first, sorted search that stops at the first netcdf file
+    stack = [input_root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = sorted(it, key=lambda e: e.name)
 
-    for curr, subdirs, files in os.walk(input_root):
-        for f in files:
-            if len(f) > 0:
-                firstfile = os.path.join(input_root, curr, f)
-                ds = Dataset(firstfile)
-                vars = ds.variables.keys()
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.nc'):
+                if not read_vars:
+                    return entry.path, None
+                with Dataset(entry.path) as ds:
+                    vars = list(ds.variables.keys())
+                return entry.path, vars
 
-                return firstfile, vars
+        stack.extend(e.path for e in reversed(entries) if e.is_dir())
 
-    raise (IOError, 'No netcdf data found under the passed root directory')
+    raise IOError('No netcdf data found under the passed root directory')
 
 
 def mkdate(datestring):
@@ -72,13 +81,22 @@ def mkdate(datestring):
         return datetime.strptime(datestring, '%Y-%m-%d')
     if len(datestring) == 16:
         return datetime.strptime(datestring, '%Y-%m-%dT%H:%M')
+    raise ValueError(f"Expected YYYY-MM-DD or YYYY-MM-DDTHH:MM, got '{datestring}'")
+
+
+_TRUE = frozenset(('True', 'true', 'TRUE', 't', 'T', '1', 'yes', 'y', 'Y'))
+_FALSE = frozenset(('False', 'false', 'FALSE', 'f', 'F', '0', 'no', 'n', 'N'))
 
 
 def str2bool(val):
-    if val in ['True', 'true', 't', 'T', '1']:
+    if isinstance(val, bool):  # e.g. when main() is called with a list of args
+        return val
+    if val in _TRUE:
         return True
-    else:
+    elif val in _FALSE:
         return False
+    else:
+        raise argparse.ArgumentTypeError(f"Boolean value expected, got '{val}'")
 
 
 def parse_args(args):
@@ -137,6 +155,15 @@ def parse_args(args):
                               "numbers make the conversion faster but "
                               "consume more memory. Default: 100."))
 
+    parser.add_argument("--n_proc", type=int, default=1,
+                        help=("Number of parallel processes to read images "
+                              "and write time series cells. Default: 1."))
+
+    parser.add_argument("--zlib", type=str2bool, default='True',
+                        help=("Compress the time series files with zlib. "
+                              "Turning this off makes the conversion faster "
+                              "but the files larger. Default: True"))
+
     args = parser.parse_args(args)
 
     print(f"Converting SMOS IC data from {args.dataset_root} between "
@@ -23,8 +23,6 @@
 # SOFTWARE.
 
 import numpy as np
-from netCDF4 import Dataset, date2num, num2date
-from smos.grid import EASE25CellGrid
 from smos.interface import SMOSImg, SMOSDs
 
 
@@ -45,9 +43,9 @@ class SMOS_IC_Img(SMOSImg):
     flatten: bool, optional (default: False)
         If set then the data is read into 1D arrays. This is used to e.g
         reshuffle the data.
-    grid : pygeogrids.CellGrid, optional (default: EASE25CellGrid)
-        Grid that the image data is organised on, by default the global EASE25
-        grid is used.
+    grid : pygeogrids.CellGrid, optional (default: None)
+        Grid that the image data is organised on, if None is passed the global
+        EASE25 grid is used.
     read_flags : tuple or None, optional (default: (0, 1))
         Filter values to read based on the selected QUALITY_FLAGS.
         Values for locations that are not assigned any of the here passed flags
@@ -59,88 +57,6 @@ class SMOS_IC_Img(SMOSImg):
         as in the data.
     """
 
-    def __init__(self, filename, mode='r', parameters=None, flatten=False,
-                 grid=EASE25CellGrid(bbox=None), read_flags=(0, 1), float_fillval=np.nan):
-
-        super(SMOSImg, self).__init__(filename, mode=mode)
-
-        if parameters is None:
-            parameters = []
-        if type(parameters) != list:
-            parameters = [parameters]
-
-        self.read_flags = read_flags
-        self.parameters = parameters
-        self.flatten = flatten
-
-        self.grid = grid
-
-        self.image_missing = False
-        self.img = None  # to be loaded
-        self.glob_attrs = None
-
-        self.float_fillval = float_fillval
-
-
-    def _read_img(self) -> (dict, dict):
-        # Read a netcdf image and metadata
-
-        ds = Dataset(self.filename)
-        self.glob_attrs = ds.__dict__
-
-        param_img = {}
-        param_meta = {}
-
-        if len(self.parameters) == 0:
-            # all data vars, exclude coord vars
-            self.parameters = [k for k in ds.variables.keys() if
-                               ds.variables[k].ndim != 1]
-
-        parameters = list(self.parameters)
-
-        if (self.read_flags is not None) and ('Quality_Flag' not in parameters):
-            parameters.append('Quality_Flag')
-
-        for parameter in parameters:
-            metadata = {}
-            param = ds.variables[parameter]
-            data = param[:]
-
-            # read long name, FillValue and unit
-            for attr in param.ncattrs():
-                metadata[attr] = param.getncattr(attr)
-
-            data.mask = ~np.isfinite(data)
-            np.ma.set_fill_value(data, metadata['_FillValue'])
-
-            metadata['image_missing'] = 0
-
-            param_img[parameter] = data
-            param_meta[parameter] = metadata
-
-        # filter with the flags (this excludes non-land points as well)
-        if self.read_flags is not None:
-            flag_mask = ~np.isin(param_img['Quality_Flag'], self.read_flags)
-        else:
-            flag_mask = np.full(param_img[parameters[0]].shape, False)
-
-        for param, data in param_img.items():
-
-            param_img[param].mask = (data.mask | flag_mask)
-
-            if self.float_fillval is not None:
-                if issubclass(data.dtype.type, np.floating):
-                    param_img[param] = data.filled(fill_value=self.float_fillval)
-
-            param_img[param] = param_img[param].flatten()[self.grid.activegpis]
-
-        if ('Quality_Flag' in param_img.keys()) and \
-                ('Quality_Flag' not in self.parameters):
-            param_img.pop('Quality_Flag')
-            param_meta.pop('Quality_Flag')
-
-        return param_img, param_meta
-
 
 class SMOS_IC_Ds(SMOSDs):
     """
@@ -157,9 +73,9 @@ class SMOS_IC_Ds(SMOSDs):
     flatten: bool, optional (default: False)
         If set then the data is read into 1D arrays. This is used to e.g
         reshuffle the data.
-    grid : pygeogrids.CellGrid, optional (default: EASE25CellGrid)
-        Grid that the image data is organised on, by default the global EASE25
-        grid is used.
+    grid : pygeogrids.CellGrid, optional (default: None)
+        Grid that the image data is organised on, if None is passed the global
+        EASE25 grid is used.
     read_flags : tuple or None, optional (default: (0, 1))
         Filter values to read based on the selected QUALITY_FLAGS.
         Values for locations that are not assigned any of the here passed flags
@@ -174,7 +90,7 @@ class SMOS_IC_Ds(SMOSDs):
     default_fname_template = "SM_RE06_MIR_CDF3S*_{datetime}T000000_{datetime}T235959_105_*_8.DBL.nc"
 
     def __init__(self, data_path, parameters=None, flatten=False,
-                 grid=EASE25CellGrid(bbox=None), filename_templ=None,
+                 grid=None, filename_templ=None,
                  read_flags=(0, 1), float_fillval=np.nan):
 
         if filename_templ is None:
@@ -8,6 +8,7 @@ from datetime import datetime
 from tqdm import tqdm
 import pandas as pd
 from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePosixPath
 from smos.misc import get_first_last_day_images
 import yaml
@@ -141,6 +142,10 @@ class SmosDissEoFtp:
             path = path / PurePosixPath(subpath)
         cmd = f"cls {path}"
         r = self.exec(cmd)
+        if r.returncode != 0:
+            # don't return an empty listing, days would be silently skipped
+            raise IOError(f"Listing {path} on {self.host} failed: "
+                          f"{r.stderr.decode('utf-8').strip()}")
         lst = r.stdout.decode("utf-8").splitlines()
 
         data = []
@@ -172,7 +177,8 @@ class SmosDissEoFtp:
         return datetime(last_year, last_month, last_day)
 
     def list_all_available_days(self, date_from=L2_START_DATE,
-                                date_to=datetime.now(), progressbar=True):
+                                date_to=datetime.now(), progressbar=True,
+                                n_threads=1):
         """
         Shortcut to get a list of all available days (i.e. folders) on the
         server within the selected time frame.
@@ -188,6 +194,11 @@ class SmosDissEoFtp:
         progressbar: bool, optional (default: True)
             This operation will send some request to the server and may take
             some time. (De)activate a visual progress representation.
+        n_threads: int, optional (default: 1)
+            Number of folders that are listed on the server at the same time.
+            Each listing is a separate lftp call (and login), which mostly
+            waits for the server. Only use more if the server accepts
+            concurrent logins.
 
         Returns
         -------
@@ -201,15 +212,28 @@ class SmosDissEoFtp:
         years = [int(y.replace('/', '')) for y in self.list(filter='dir')]
         years = [y for y in years if ((y >= date_from.year) and (y <= date_to.year))]
 
-        for year in tqdm(years, disable=not progressbar, description="Scanning FTP folder"):
-            months = [int(m.replace('/', '')) for m in self.list(subpath=str(year), filter='dir')]
-            if year == date_from.year:
-                months = [m for m in months if m >= date_from.month]
-            if year == date_to.year:
-                months = [m for m in months if m <= date_to.month]
-            for month in months:
-                days = self.list(subpath=f"{year}/{month:02}", filter='dir')
-                for day in days:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            year_months = executor.map(
+                lambda y: self.list(subpath=str(y), filter='dir'), years)
+
+            periods = []
+            for year, months in zip(years, year_months):
+                months = [int(m.replace('/', '')) for m in months]
+                if year == date_from.year:
+                    months = [m for m in months if m >= date_from.month]
+                if year == date_to.year:
+                    months = [m for m in months if m <= date_to.month]
+                periods += [(year, month) for month in months]
+
+            # the days of all months are listed in parallel, but collected
+            # in the order of the months
+            futures = [executor.submit(self.list, subpath=f"{year}/{month:02}",
+                                       filter='dir') for year, month in periods]
+
+            for (year, month), future in zip(
+                    periods, tqdm(futures, disable=not progressbar,
+                                  desc="Scanning FTP folder")):
+                for day in future.result():
                     dt = datetime(int(year),
                                   int(month),
                                   int(day.replace('/', '')))
@@ -289,21 +313,20 @@ class SmosDissEoFtp:
         startdate = pd.to_datetime(startdate)
         enddate = pd.to_datetime(enddate)
 
-        df = pd.Series(index=pd.date_range(startdate, enddate, freq='D'),
-                       data=1)
+        days = pd.date_range(startdate, enddate, freq='D')
+        months = days.to_period('M')
+        n_days = months.value_counts()  # days in the period for each month
 
         ret = []
 
-        for year, ys in df.groupby(df.index.year):
-            for month, ms in ys.groupby(df.index.month):
-                if len(ms) == monthrange(year, month)[1]:  # complete month (fast)
-                    r = self.sync(int(year), int(month), day=None, dry_run=dry_run)
+        for month in months.unique():
+            if n_days[month] == month.days_in_month:  # complete month (fast)
+                r = self.sync(month.year, month.month, day=None, dry_run=dry_run)
+                ret.append(r)
+            else:  # individual days (slow)
+                for dt in days[months == month]:
+                    r = self.sync(dt.year, dt.month, dt.day, dry_run=dry_run)
                     ret.append(r)
-                else:  # individual days (slow)
-                    for dt in ms.index.values:
-                        dt = pd.Timestamp(dt).to_pydatetime()
-                        r = self.sync(dt.year, dt.month, dt.day, dry_run=dry_run)
-                        ret.append(r)
 
         first_day, last_day = get_first_last_day_images(str(self.local_root))
 
@@ -23,8 +23,6 @@
 # SOFTWARE.
 
 import numpy as np
-from netCDF4 import Dataset
-from smos.grid import EASE25CellGrid
 from smos.interface import SMOSImg, SMOSDs
 
 
@@ -45,9 +43,9 @@ class SMOS_L4_Img(SMOSImg):
     flatten: bool, optional (default: False)
         If set then the data is read into 1D arrays. This is used to e.g
         reshuffle the data.
-    grid : pygeogrids.CellGrid, optional (default: EASE25CellGrid)
-        Grid that the image data is organised on, by default the global EASE25
-        grid is used.
+    grid : pygeogrids.CellGrid, optional (default: None)
+        Grid that the image data is organised on, if None is passed the global
+        EASE25 grid is used.
     read_flags : tuple, list, np.array or None, optional (default: np.linspace(0,1,6,endpoint=True))
         Filter values to read based on the selected quality flags.
         Values for locations that are not assigned any of the here passed flags
@@ -64,103 +62,19 @@ class SMOS_L4_Img(SMOSImg):
     """
 
     def __init__(self, filename, mode='r', parameters=None, flatten=False,
-                 grid=EASE25CellGrid(bbox=None), read_flags=np.linspace(0,1,6,endpoint=True),
+                 grid=None, read_flags=np.linspace(0,1,6,endpoint=True),
                  oper=False, float_fillval=np.nan):
 
-        super().__init__(filename, mode=mode)
-
-        if parameters is None:
-            parameters = []
-        if type(parameters) != list:
-            parameters = [parameters]
-
-        self.read_flags = read_flags
-        self.parameters = parameters
-        self.flatten = flatten
+        super().__init__(filename, mode=mode, parameters=parameters,
+                         flatten=flatten, grid=grid, read_flags=read_flags,
+                         float_fillval=float_fillval)
 
         self.oper = oper
 
-        self.grid = grid
-
-        self.image_missing = False
-        self.img = None  # to be loaded
-        self.glob_attrs = None
-
-        self.float_fillval = float_fillval
-
-
-    def _read_img(self) -> (dict, dict):
-        # Read a netcdf image and metadata
-
-        ds = Dataset(self.filename)
-        self.glob_attrs = ds.__dict__
-
-        param_img = {}
-        param_meta = {}
-
-        if len(self.parameters) == 0:
-            # all data vars, exclude coord vars
-            self.parameters = [k for k in ds.variables.keys() if
-                               ds.variables[k].ndim != 1]
-
-        parameters = list(self.parameters)
-
-        if not self.oper:
-            if (self.read_flags is not None) and ('QUAL' not in parameters):
-                parameters.append('QUAL')
-        else:
-            if (self.read_flags is not None) and ('Quality' not in parameters):
-                parameters.append('Quality')
-
-        for parameter in parameters:
-            metadata = {}
-            param = ds.variables[parameter]
-            data = param[:]
-
-            # read long name, FillValue and unit
-            for attr in param.ncattrs():
-                metadata[attr] = param.getncattr(attr)
-
-            data.mask = ~np.isfinite(data)
-            np.ma.set_fill_value(data, metadata['_FillValue'])
-
-            metadata['image_missing'] = 0
-
-            param_img[parameter] = data
-            param_meta[parameter] = metadata
-
-        # filter with the flags (this excludes non-land points as well)
-        if self.read_flags is not None:
-            if not self.oper:
-                flag_mask = ~np.isin(param_img['QUAL'], self.read_flags)
-            else:
-                flag_mask = ~np.isin(param_img['Quality'], self.read_flags)
-
-        else:
-            flag_mask = np.full(param_img[parameters[0]].shape, False)
-
-        for param, data in param_img.items():
-
-            param_img[param].mask = (data.mask | flag_mask)
-
-            if self.float_fillval is not None:
-                if issubclass(data.dtype.type, np.floating):
-                    param_img[param] = data.filled(fill_value=self.float_fillval)
-
-            param_img[param] = param_img[param].flatten()[self.grid.activegpis]
-
-        if not self.oper:
-            if ('QUAL' in param_img.keys()) and \
-                    ('QUAL' not in self.parameters):
-                param_img.pop('QUAL')
-                param_meta.pop('QUAL')
-        else:
-            if ('Quality' in param_img.keys()) and \
-                    ('Quality' not in self.parameters):
-                param_img.pop('Quality')
-                param_meta.pop('Quality')
-
-        return param_img, param_meta
+    @property
+    def _flag_var(self):
+        # the quality flags are named differently in the operational product
+        return 'Quality' if self.oper else 'QUAL'
 
 
 class SMOS_L4_Ds(SMOSDs):
@@ -179,9 +93,9 @@ class SMOS_L4_Ds(SMOSDs):
     flatten: bool, optional (default: False)
         If set then the data is read into 1D arrays. This is used to e.g
         reshuffle the data.
-    grid : pygeogrids.CellGrid, optional (default: EASE25CellGrid)
-        Grid that the image data is organised on, by default the global EASE25
-        grid is used.
+    grid : pygeogrids.CellGrid, optional (default: None)
+        Grid that the image data is organised on, if None is passed the global
+        EASE25 grid is used.
     read_flags : tuple, list, np.array or None, optional (default: np.linspace(0,1,6,endpoint=True))
         Filter values to read based on the selected quality flags.
         Values for locations that are not assigned any of the here passed flags
@@ -200,7 +114,7 @@ class SMOS_L4_Ds(SMOSDs):
     default_fname_template = "SM_*_MIR_CLF4RD*_{datetime}T000000_{datetime}T235959_*_*_*.DBL.nc"
 
     def __init__(self, data_path, parameters=None, flatten=False,
-                 grid=EASE25CellGrid(bbox=None), filename_templ=None,
+                 grid=None, filename_templ=None,
                  read_flags=np.linspace(0,1,6,endpoint=True), oper=False, float_fillval=np.nan):
 
         if filename_templ is None:
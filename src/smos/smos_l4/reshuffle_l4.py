@@ -38,7 +38,7 @@ from smos.reshuffle import firstfile, mkdate, str2bool, parse_args
 
 def reshuffle(input_root, outputpath,
               startdate, enddate,
-              imgbuffer=200, **ds_kwargs):
+              imgbuffer=200, n_proc=1, zlib=True, **ds_kwargs):
     """
     Reshuffle method applied to SMOS image data.
 
@@ -54,11 +54,18 @@ def reshuffle(input_root, outputpath,
         End date.
     imgbuffer: int, optional
         How many images to read at once before writing time series.
+    n_proc: int, optional (default: 1)
+        Number of parallel processes to read images and write time series
+        (the 5x5 degree cells are written independently).
+    zlib: bool, optional (default: True)
+        Compress the time series files. Writing uncompressed files is faster,
+        but they take up more space.
     ds_kwargs: dict
         Kwargs that are passed to the image datastack class
     """
 
-    ff, file_vars = firstfile(input_root)
+    # the file is opened only once, when reading the attributes below
+    ff, _ = firstfile(input_root, read_vars=False)
     fp, ff = os.path.split(ff)
 
     if 'grid' not in ds_kwargs.keys():
@@ -66,11 +73,11 @@ def reshuffle(input_root, outputpath,
     if 'parameters' not in ds_kwargs.keys():
         ds_kwargs['parameters'] = None
 
-    # this is only for reading the ts_attrs
+    # this is only for reading the ts_attrs (the data is not read)
     input_dataset = SMOS_L4_Img(filename=os.path.join(fp, ff),
                             parameters=ds_kwargs['parameters'], flatten=True, read_flags=None,
                             grid=ds_kwargs['grid'], oper=ds_kwargs['oper'] if 'oper' in ds_kwargs else False)
-    _, ts_attributes = input_dataset._read_img()
+    ts_attributes = input_dataset._read_metadata()
     global_attr = input_dataset.get_global_attrs()
 
     if ds_kwargs['parameters'] is None:
@@ -86,8 +93,9 @@ def reshuffle(input_root, outputpath,
                         startdate=startdate, enddate=enddate,
                         input_grid=ds_kwargs['grid'].cut(),  # drop points that are not subset
                         imgbuffer=imgbuffer, cellsize_lat=5.0,
-                        cellsize_lon=5.0, global_attr=global_attr, zlib=True,
-                        unlim_chunksize=1000, ts_attributes=ts_attributes)
+                        cellsize_lon=5.0, global_attr=global_attr, zlib=zlib,
+                        unlim_chunksize=1000, ts_attributes=ts_attributes,
+                        n_proc=n_proc, backend='multiprocessing')
     reshuffler.calc()
 
 
@@ -113,6 +121,8 @@ def main(args):
               args.start,
               args.end,
               imgbuffer=args.imgbuffer,
+              n_proc=args.n_proc,
+              zlib=args.zlib,
               **ds_kwargs)
 
 
@@ -1,4 +1,8 @@
 import os
+import time
+import subprocess
+import pytest
+from datetime import datetime
 from tempfile import TemporaryDirectory
 from smos.smos_l2.download import SmosDissEoFtp
 from smos.misc import read_summary_yml
@@ -26,5 +30,67 @@ def test_download_l2_period():
         assert props['last_day'] is None
         assert props['last_update'] is not None
 
+def test_download_l2_period_multiple_years(monkeypatch):
+    with TemporaryDirectory() as tempdir:
+        ftp = SmosDissEoFtp(local_root=tempdir, username='asd', password='asd',
+                            skip_lftp_verify=True)
+        calls = []
+        monkeypatch.setattr(
+            ftp, 'sync', lambda year, month, day=None, dry_run=False:
+            calls.append((year, month, day)))
+
+        # whole months over the year boundary, one call per month
+        ftp.sync_period('2019-11-01', '2020-02-29')
+        assert calls == [(2019, 11, None), (2019, 12, None),
+                         (2020, 1, None), (2020, 2, None)]
+
+        # incomplete first and last month, one call per day
+        calls.clear()
+        ftp.sync_period('2019-12-30', '2020-02-02')
+        assert calls == [(2019, 12, 30), (2019, 12, 31), (2020, 1, None),
+                         (2020, 2, 1), (2020, 2, 2)]
+
+
+def test_list_all_available_days(monkeypatch):
+    def _list(subpath='', filter='all'):
+        # fake server, later months are listed faster than earlier ones
+        parts = [p for p in subpath.split('/') if p]
+        if len(parts) == 2:
+            time.sleep((13 - int(parts[1])) * 0.002)
+        if len(parts) == 0:
+            folders = [f"{y}/" for y in (2010, 2011, 2012)]
+        elif len(parts) == 1:
+            folders = [f"{m:02}/" for m in range(1, 13)]
+        else:
+            folders = [f"{d:02}/" for d in (1, 2, 3)]
+        return folders
+
+    with TemporaryDirectory() as tempdir:
+        ftp = SmosDissEoFtp(local_root=tempdir, username='asd', password='asd',
+                            skip_lftp_verify=True)
+        monkeypatch.setattr(ftp, 'list', _list)
+
+        dates = ftp.list_all_available_days(date_from=datetime(2010, 6, 2),
+                                            date_to=datetime(2012, 2, 1),
+                                            progressbar=True, n_threads=4)
+
+        assert dates == sorted(set(dates))
+        assert len(dates) == 7 * 3 - 1 + 12 * 3 + 3 + 1
+        assert dates[0] == datetime(2010, 6, 2)
+        assert dates[-1] == datetime(2012, 2, 1)
+
+
+def test_list_failed(monkeypatch):
+    with TemporaryDirectory() as tempdir:
+        ftp = SmosDissEoFtp(local_root=tempdir, username='asd', password='asd',
+                            skip_lftp_verify=True)
+        monkeypatch.setattr(
+            ftp, 'exec', lambda cmd: subprocess.CompletedProcess(
+                cmd, 1, stdout=b'', stderr=b'Login failed'))
+
+        with pytest.raises(IOError, match='Login failed'):
+            ftp.list(subpath='2022/01', filter='dir')
+
+
 if __name__ == '__main__':
     test_download_l2_period()
\ No newline at end of file
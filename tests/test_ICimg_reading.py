@@ -125,3 +125,28 @@ def test_SMOS_IC_ts_for_daterange():
                        datetime(2018, 1, 3),
                        datetime(2018, 1, 4),
                        datetime(2018, 1, 5)]
+
+
+def test_SMOS_IC_Ds_search_new_files(tmp_path):
+    # files that are added after the first search (e.g. during an update) are
+    # found, also when the subdir did not exist before, deleted files are not
+    ds = SMOS_IC_Ds(str(tmp_path), parameters=['Soil_Moisture'])
+    fname = "SM_RE06_MIR_CDF3SA_{d}T000000_{d}T235959_105_001_8.DBL.nc"
+
+    assert ds._search_files(datetime(2018, 1, 1)) == []
+
+    os.makedirs(tmp_path / '2018')
+    (tmp_path / '2018' / fname.format(d='20180101')).touch()
+    assert ds._search_files(datetime(2018, 1, 1)) == \
+           [os.path.join(str(tmp_path), '2018', fname.format(d='20180101'))]
+    assert ds._search_files(datetime(2018, 1, 2)) == []
+
+    (tmp_path / '2018' / fname.format(d='20180102')).touch()
+    assert ds._search_files(datetime(2018, 1, 2)) == \
+           [os.path.join(str(tmp_path), '2018', fname.format(d='20180102'))]
+
+    # deleted files are not found anymore
+    os.remove(tmp_path / '2018' / fname.format(d='20180101'))
+    assert ds._search_files(datetime(2018, 1, 1)) == []
+    assert ds._search_files(datetime(2018, 1, 2)) == \
+           [os.path.join(str(tmp_path), '2018', fname.format(d='20180102'))]
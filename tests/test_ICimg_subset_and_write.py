@@ -31,6 +31,8 @@ import numpy as np
 import numpy.testing as nptest
 from datetime import datetime
 from tempfile import mkdtemp
+from netCDF4 import Dataset
+from ease_grid import EASE2_grid
 from smos.grid import EASE25CellGrid
 import pytest
 
@@ -75,3 +77,71 @@ def test_SMOS_IC_Ds_subset(stackfile, files):
         ds.write_multiple(root_path=outdir, start_date=datetime(2018, 1, 1),
                           end_date=datetime(2018, 1, 3), stackfile=stackfile)
         assert len(os.listdir(outdir)) == 1  # 1 stack
+
+
+def _synthetic_ic_images(root, days):
+    # global images with random soil moisture and flags
+    ease25 = EASE2_grid(25000)
+    shape = (ease25.latdim.size, ease25.londim.size)
+    rng = np.random.default_rng(42)
+    fname = "SM_RE06_MIR_CDF3SA_{d}T000000_{d}T235959_105_001_8.DBL.nc"
+    os.makedirs(os.path.join(root, '2018'))
+    for d in days:
+        with Dataset(os.path.join(root, '2018', fname.format(d=d.strftime('%Y%m%d'))), 'w') as ds:
+            ds.createDimension('lat', shape[0])
+            ds.createDimension('lon', shape[1])
+            ds.createVariable('lat', 'f8', ('lat',))[:] = ease25.latdim
+            ds.createVariable('lon', 'f8', ('lon',))[:] = ease25.londim
+            v = ds.createVariable('Soil_Moisture', 'f4', ('lat', 'lon'), fill_value=-999.)
+            v.setncatts({'long_name': 'Soil Moisture', 'units': 'm3 m-3'})
+            v[:] = rng.random(shape).astype('f4')
+            v = ds.createVariable('Quality_Flag', 'i1', ('lat', 'lon'), fill_value=-1)
+            v.setncatts({'long_name': 'Quality Flag', 'units': '-'})
+            v[:] = rng.integers(0, 3, shape)
+
+
+def _read_written(path):
+    with Dataset(path) as ds:
+        return {k: v[:] for k, v in ds.variables.items()}
+
+
+def test_SMOS_IC_Ds_write_multiple_parallel(tmp_path):
+    # images written in parallel processes are the same as written in one
+    days = [datetime(2018, 1, d) for d in (1, 2, 3, 5)]  # Jan 4th is missing
+    _synthetic_ic_images(str(tmp_path / 'img'), days)
+
+    subgrid = EASE25CellGrid(bbox=(-11., 34., 43., 71.))
+    ds = SMOS_IC_Ds(str(tmp_path / 'img'), parameters=['Soil_Moisture', 'Quality_Flag'],
+                    grid=subgrid, read_flags=(0, 1))
+
+    for n_proc in (1, 2):
+        ds.write_multiple(root_path=str(tmp_path / f"single_{n_proc}"),
+                          start_date=datetime(2018, 1, 1), end_date=datetime(2018, 1, 5),
+                          stackfile=None, n_proc=n_proc)
+    # uncompressed stack, appended image by image to one open file
+    ds.write_multiple(root_path=str(tmp_path), start_date=datetime(2018, 1, 1),
+                      end_date=datetime(2018, 1, 5), stackfile='stack.nc', complevel=0)
+
+    files = sorted(os.listdir(tmp_path / 'single_1' / '2018'))
+    assert files == sorted(os.listdir(tmp_path / 'img' / '2018'))
+    assert sorted(os.listdir(tmp_path / 'single_2' / '2018')) == files
+
+    stack = _read_written(str(tmp_path / 'stack.nc'))
+    assert stack['Soil_Moisture'].shape == (4, 113, 208)
+
+    for i, f in enumerate(files):
+        single = _read_written(str(tmp_path / 'single_1' / '2018' / f))
+        parallel = _read_written(str(tmp_path / 'single_2' / '2018' / f))
+        assert single.keys() == parallel.keys() == stack.keys()
+        for var in single:
+            nptest.assert_array_equal(single[var], parallel[var])
+            if var in ('lat', 'lon'):
+                nptest.assert_array_equal(single[var], stack[var])
+            else:
+                nptest.assert_array_equal(single[var][0], stack[var][i])
+
+    with Dataset(str(tmp_path / 'single_2' / '2018' / files[0])) as single, \
+            Dataset(str(tmp_path / 'stack.nc')) as stack:
+        assert single.variables['Soil_Moisture'].filters()['complevel'] == 4
+        assert stack.variables['Soil_Moisture'].filters()['zlib'] is False
+        assert stack.variables['Soil_Moisture'].chunking() == [1, 113, 208]
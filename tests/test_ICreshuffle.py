@@ -83,3 +83,31 @@ def test_SMOS_IC_reshuffle_subset():
         assert np.isnan(ds.read(-4.7, 65)['Soil_Moisture'].iloc[0])
 
         ds.close()
+
+
+def test_SMOS_IC_reshuffle_parallel(capfd):
+    inpath = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "smos-test-data", "L3_SMOS_IC", "ASC")
+    bbox = ['-11', '34', '43', '71']
+    with tempfile.TemporaryDirectory() as ts_path, \
+            tempfile.TemporaryDirectory() as ts_path_par:
+        # a second parallel run in the same process must start new workers that
+        # log without errors (not workers of the first run with a closed log queue)
+        for path, n_proc in [(ts_path, '1'), (ts_path_par, '2'),
+                             (os.path.join(ts_path_par, 'rerun'), '2')]:
+            main([inpath, path, '2018-01-01', '2018-01-03', '--bbox', *bbox,
+                  '--n_proc', n_proc])
+
+        # worker processes must not fail to log to a closed queue
+        assert 'Logging error' not in capfd.readouterr().err
+        assert len(glob.glob(os.path.join(ts_path_par, "*.nc"))) == 109
+
+        ds = SMOSTs(ts_path, drop_missing=False)
+        ds_par = SMOSTs(ts_path_par, drop_missing=False)
+        for lon, lat in [(20.36023, 47.682177), (-4.7, 56.9)]:
+            ts, ts_par = ds.read(lon, lat), ds_par.read(lon, lat)
+            assert ts.index.equals(ts_par.index)
+            for col in ts.columns:
+                nptest.assert_array_equal(ts[col].values, ts_par[col].values)
+        ds.close()
+        ds_par.close()
@@ -41,3 +41,13 @@ def test_EASE25CellGrid():
     nptest.assert_almost_equal(grid.activearrlat[316922], -12.55398284007352, 5)
     nptest.assert_almost_equal(grid.activearrlon[316922], -61.08069164265129, 5)
     assert grid.activearrcell[316922] == 843
+
+
+def test_EASE25CellGrid_cached():
+    grid = EASE25CellGrid(bbox=[-11., 34., 43., 71.])
+    other = EASE25CellGrid(bbox=(-11., 34., 43., 71.))
+    # grid definition is only built once per bbox
+    assert grid.arrlon is other.arrlon
+    assert grid.subset is other.subset
+    assert grid.subset_shape == other.subset_shape == (113, 208)
+    assert EASE25CellGrid().subset_shape == (584, 1388)
@@ -23,4 +23,17 @@ def test_first_last_date():
 
     s, e = get_first_last_day_images(os.path.join(rootf, 'L4_SMOS_RZSM', 'OPER'))
     assert s == datetime.date(2020,1,31)
-    assert e == datetime.date(2020,1,31)
\ No newline at end of file
+    assert e == datetime.date(2020,1,31)
+
+def test_first_last_date_empty_last_day(tmp_path):
+    # year/month/day folders, the last day folder has no images (yet)
+    fname = "SM_OPER_MIR_SMUDP2_{d}T000000_{d}T010000_700_001_1.nc"
+    for y, m, d in [('2021', '12', '30'), ('2021', '12', '31'),
+                    ('2022', '01', '01')]:
+        os.makedirs(tmp_path / y / m / d)
+        (tmp_path / y / m / d / fname.format(d=y + m + d)).touch()
+    os.makedirs(tmp_path / '2022' / '01' / '02')
+
+    s, e = get_first_last_day_images(str(tmp_path))
+    assert s == datetime.date(2021, 12, 30)
+    assert e is None
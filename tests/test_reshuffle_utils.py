@@ -0,0 +1,65 @@
+import os
+import argparse
+from datetime import datetime
+
+import pytest
+from netCDF4 import Dataset
+
+from smos.reshuffle import str2bool, mkdate, firstfile
+
+
+@pytest.mark.parametrize("val", ['True', 'true', 'TRUE', 't', 'T', '1',
+                                 'yes', 'y', 'Y', True])
+def test_str2bool_true(val):
+    assert str2bool(val) is True
+
+
+@pytest.mark.parametrize("val", ['False', 'false', 'FALSE', 'f', 'F', '0',
+                                 'no', 'n', 'N', False])
+def test_str2bool_false(val):
+    assert str2bool(val) is False
+
+
+@pytest.mark.parametrize("val", ['', 'maybe', '2', 'Yes please'])
+def test_str2bool_invalid(val):
+    with pytest.raises(argparse.ArgumentTypeError):
+        str2bool(val)
+
+
+def test_mkdate():
+    assert mkdate('2018-01-02') == datetime(2018, 1, 2)
+    assert mkdate('2018-01-02T03:04') == datetime(2018, 1, 2, 3, 4)
+
+
+@pytest.mark.parametrize("val", ['20180102', '2018-01-02T03', '2018-13-01',
+                                 '2018-01-02T03:04:05', '2018-W01-1',
+                                 '2018-01-02 03:04', '2018-01-02+01:00',
+                                 '20180102T0304+01'])
+def test_mkdate_invalid(val):
+    with pytest.raises(ValueError):
+        mkdate(val)
+
+
+def test_firstfile_no_data(tmp_path):
+    os.makedirs(tmp_path / '2018')
+    (tmp_path / '2018' / 'readme.txt').touch()
+    with pytest.raises(IOError):
+        firstfile(str(tmp_path))
+
+
+def test_firstfile_sorted(tmp_path):
+    for y, d in [('2019', '20190101'), ('2018', '20180102'), ('2018', '20180101')]:
+        os.makedirs(tmp_path / y, exist_ok=True)
+        with Dataset(tmp_path / y / f"img_{d}.nc", 'w') as ds:
+            ds.createDimension('lat', 2)
+            ds.createVariable('lat', 'f8', ('lat',))
+            ds.createVariable('sm', 'f4', ('lat',))
+    (tmp_path / '2018' / 'a.txt').touch()
+
+    path, vars = firstfile(str(tmp_path))
+    assert path == os.path.join(str(tmp_path), '2018', 'img_20180101.nc')
+    assert vars == ['lat', 'sm']
+
+    path, vars = firstfile(str(tmp_path), read_vars=False)
+    assert path == os.path.join(str(tmp_path), '2018', 'img_20180101.nc')
+    assert vars is None